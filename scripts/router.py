@@ -16,44 +16,112 @@ Features:
 - OpenClaw integration for spawning sub-agents
 """
 
+from __future__ import annotations
+
+import argparse
 import json
-import math
 import os
 import re
 import sys
 from pathlib import Path
+from typing import Any, ClassVar
 
 # OpenClaw imports (if available)
 try:
-    import openclaw
+    import openclaw  # type: ignore[import-not-found]
     HAS_OPENCLAW = True
 except ImportError:
     HAS_OPENCLAW = False
 
+# Optional Aho-Corasick matcher (pip install pyahocorasick); regex fallback otherwise
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional fast JSON parser (pip install orjson); stdlib json otherwise
+try:
+    import orjson  # type: ignore[import-not-found]
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Removed get_openclaw_gateway_config() - gateway auth secrets should not be exposed in router output
 # Use gateway-guard skill separately if gateway auth management is needed
 
+# Max classifications memoized per router instance
+_CLASSIFY_CACHE_MAX = 256
+
+# Raw JSON file bytes keyed by (path, mtime_ns, size), so an edited file is re-read.
+# Bytes are immutable; every load parses its own dict, so routers never share config.
+_json_cache: dict[tuple[str, int, int], bytes] = {}
+_JSON_CACHE_MAX = 8
+
+
+def _load_json(path):
+    """Load a JSON file into a fresh object, skipping the read while the file is unchanged."""
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    raw = _json_cache.get(key)
+    if raw is None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if len(_json_cache) >= _JSON_CACHE_MAX:
+            _json_cache.pop(next(iter(_json_cache)))
+        _json_cache[key] = raw
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def _compile_keywords(keywords: list[str]) -> tuple[re.Pattern[str], dict[str, frozenset[str]]]:
+    """
+    Compile a keyword list into a single lookahead alternation.
+    
+    Longest keywords are tried first and each hit also credits the shorter
+    keywords it starts with, so 'reasoning' still counts 'reason' too —
+    the same distinct-substring count as checking every keyword with `in`.
+    
+    Returns: (pattern, prefixes)
+    """
+    kws = sorted({kw.lower() for kw in keywords}, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(kw) for kw in kws) + '))')
+    prefixes = {kw: frozenset(k for k in kws if kw.startswith(k)) for kw in kws}
+    return pattern, prefixes
+
+
+def _build_automaton(keyword_sets: dict[str, list[str]]) -> Any:
+    """Build one Aho-Corasick automaton over every keyword, tagged with its set keys."""
+    tagged: dict[str, list[str]] = {}
+    for key, keywords in keyword_sets.items():
+        for kw in keywords:
+            tagged.setdefault(kw.lower(), []).append(key)
+    automaton = ahocorasick.Automaton()
+    for kw, keys in tagged.items():
+        automaton.add_word(kw, (kw, tuple(keys)))
+    automaton.make_automaton()
+    return automaton
+
 
 class FridayRouter:
     """Austin's intelligent model router with fixed scoring."""
     
     # Simple indicators that suggest SIMPLE/Fast tasks (NOT inverted anymore)
-    SIMPLE_KEYWORDS = [
+    SIMPLE_KEYWORDS: ClassVar[list[str]] = [
         'check', 'get', 'fetch', 'list', 'show', 'display', 'status',
         'what is', 'how much', 'tell me', 'find', 'search', 'summarize',
         'monitor', 'watch', 'read', 'look', 'simple', 'quick', 'fast'
     ]
     
     # Complex indicators that suggest QUALITY/Code tasks
-    COMPLEX_KEYWORDS = [
+    COMPLEX_KEYWORDS: ClassVar[list[str]] = [
         'build', 'create', 'implement', 'architect', 'design', 'system',
         'comprehensive', 'thorough', 'complex', 'multi', 'full-stack',
         'authentication', 'authorization', 'database', 'api', 'service'
     ]
     
     # Code-related keywords
-    CODE_KEYWORDS = [
+    CODE_KEYWORDS: ClassVar[list[str]] = [
         'code', 'function', 'class', 'method', 'debug', 'fix', 'bug',
         'refactor', 'lint', 'test', 'unit', 'integration', 'component',
         'module', 'package', 'library', 'framework', 'import', 'export',
@@ -62,33 +130,71 @@ class FridayRouter:
     ]
     
     # Reasoning keywords
-    REASONING_KEYWORDS = [
+    REASONING_KEYWORDS: ClassVar[list[str]] = [
         'prove', 'theorem', 'proof', 'derive', 'logic', 'reason',
         'analyze', 'reasoning', 'step by step', 'why', 'how does',
         'explain', 'mathematical', 'induction', 'deduction'
     ]
     
     # Creative keywords
-    CREATIVE_KEYWORDS = [
+    CREATIVE_KEYWORDS: ClassVar[list[str]] = [
         'creative', 'write', 'story', 'poem', 'article', 'blog',
         'design', 'UI', 'UX', 'frontend', 'website', 'landing',
         'copy', 'narrative', 'brainstorm', 'idea', 'concept'
     ]
     
     # Research keywords
-    RESEARCH_KEYWORDS = [
+    RESEARCH_KEYWORDS: ClassVar[list[str]] = [
         'research', 'find', 'search', 'lookup', 'web', 'information',
         'fact', 'review', 'compare', 'vs', 'versus', 'difference',
         'summary of', 'what are', 'best', 'top', 'alternatives'
     ]
     
     # Agentic/action keywords (multi-step tasks)
-    AGENTIC_KEYWORDS = [
+    AGENTIC_KEYWORDS: ClassVar[list[str]] = [
         'run', 'test', 'fix', 'deploy', 'edit', 'build', 'create',
         'implement', 'execute', 'refactor', 'migrate', 'integrate',
         'setup', 'configure', 'install', 'compile', 'debug'
     ]
     
+    # Vision keywords (force VISION tier when present)
+    VISION_KEYWORDS: ClassVar[list[str]] = [
+        'image', 'picture', 'photo', 'screenshot', 'visual', 'see', 'describe what'
+    ]
+    
+    # Website/frontend project keywords (always CREATIVE, never CODE)
+    WEBSITE_PROJECT_KEYWORDS: ClassVar[list[str]] = [
+        'website', 'web site', 'landing page', 'landing', 'frontend',
+        'community site', 'online community', 'build a site', 'new site'
+    ]
+    
+    # Multi-step patterns (bump agentic tasks to at least CODE); the first/then gap
+    # is bounded so long task descriptions cannot trigger quadratic backtracking
+    MULTI_STEP_PATTERNS: ClassVar[list[str]] = [
+        r'\bfirst\b.{0,120}?\bthen\b', r'\bstep\s+\d+', r'\d+\.\s+\w+',
+        r'\bnext\b', r'\bafter\b', r'\bfinally\b', r',\s*then\b'
+    ]
+    _MULTI_STEP_RE: ClassVar[re.Pattern[str]] = re.compile('|'.join(MULTI_STEP_PATTERNS))
+    
+    # Keyword sets scored by classify_task, keyed by tier (plus AGENTIC/WEBSITE)
+    _KEYWORD_SETS: ClassVar[dict[str, list[str]]] = {
+        'FAST': SIMPLE_KEYWORDS,
+        'REASONING': REASONING_KEYWORDS,
+        'CREATIVE': CREATIVE_KEYWORDS,
+        'RESEARCH': RESEARCH_KEYWORDS,
+        'CODE': CODE_KEYWORDS,
+        'COMPLEX': COMPLEX_KEYWORDS,
+        'VISION': VISION_KEYWORDS,
+        'AGENTIC': AGENTIC_KEYWORDS,
+        'WEBSITE': WEBSITE_PROJECT_KEYWORDS,
+    }
+    
+    # Matchers built once at import: one regex per set, or a single automaton for all sets
+    _KEYWORD_PATTERNS: ClassVar[dict[str, tuple[re.Pattern[str], dict[str, frozenset[str]]]]] = {
+        key: _compile_keywords(kws) for key, kws in _KEYWORD_SETS.items()
+    }
+    _AUTOMATON: ClassVar[Any] = _build_automaton(_KEYWORD_SETS) if HAS_AHOCORASICK else None
+    
     def __init__(self, config_path=None):
         """Initialize router with config file."""
         if config_path is None:
@@ -97,48 +203,87 @@ class FridayRouter:
             config_path = script_dir.parent / 'config.json'
         
         self.config_path = Path(config_path)
-        self.config = self._load_config()
+        self._load_config()
         
         # Removed troubleshooting loop detection and FACEPALM integration
         # Use FACEPALM skill separately if troubleshooting is needed
     
     def _load_config(self):
-        """Load and parse configuration file."""
+        """Load and parse configuration file, rebuilding everything derived from it."""
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
+        self.config = _load_json(self.config_path)
+        
+        # Index models by id (first entry wins, as with the old linear scan)
+        self._models_by_id = {}
+        for m in self.config.get('models', []):
+            self._models_by_id.setdefault(m['id'], m)
+        
+        # Classification results keyed by task text, dropped on every (re)load
+        self._classify_cache = {}
+        
+        return self.config
+    
+    def _keyword_match(self, text_lower: str, key: str) -> int:
+        """Count distinct keyword matches for a keyword set (text must be lowercased)."""
+        pattern, prefixes = self._KEYWORD_PATTERNS[key]
+        found: set[str] = set()
+        for kw in pattern.findall(text_lower):
+            found |= prefixes[kw]
+        return len(found)
     
-    def _keyword_match(self, text, keywords):
-        """Count keyword matches (case-insensitive)."""
-        text_lower = text.lower()
-        return sum(1 for kw in keywords if kw.lower() in text_lower)
+    def _keyword_counts(self, text_lower: str) -> dict[str, int]:
+        """Count distinct keyword matches for every keyword set in one pass (text must be lowercased)."""
+        if self._AUTOMATON is None:
+            return {key: self._keyword_match(text_lower, key) for key in self._KEYWORD_SETS}
+        
+        found: dict[str, set[str]] = {key: set() for key in self._KEYWORD_SETS}
+        for _, (kw, keys) in self._AUTOMATON.iter(text_lower):
+            for key in keys:
+                found[key].add(kw)
+        return {key: len(kws) for key, kws in found.items()}
     
-    def classify_task(self, task_description, return_details=False):
+    def classify_task(self, task_description: str, return_details: bool = False) -> str | dict[str, Any]:
         """
         Classify a task into a tier using keyword matching + scoring.
         
         Returns: FAST, REASONING, CREATIVE, RESEARCH, CODE, QUALITY, or VISION
         """
-        text = task_description.lower()
+        result = self._classify_cache.get(task_description)
+        if result is None:
+            result = self._classify(task_description)
+            if len(self._classify_cache) >= _CLASSIFY_CACHE_MAX:
+                self._classify_cache.pop(next(iter(self._classify_cache)))
+            self._classify_cache[task_description] = result
         
-        # First, check for exact keyword tier matches (highest priority)
-        tier_scores = {}
+        if not return_details:
+            return result['tier']
+        
+        # Copy so callers can't mutate the cached result
+        return {**result, 'tier_scores': dict(result['tier_scores'])}
+    
+    def _classify(self, task_description: str) -> dict[str, Any]:
+        """Score a task and return the full classification details."""
+        # Lowercase once; keyword sets are lowercased when compiled
+        text = task_description.lower()
         
-        # Count matches for each tier
-        tier_scores['FAST'] = self._keyword_match(task_description, self.SIMPLE_KEYWORDS)
-        tier_scores['REASONING'] = self._keyword_match(task_description, self.REASONING_KEYWORDS)
-        tier_scores['CREATIVE'] = self._keyword_match(task_description, self.CREATIVE_KEYWORDS)
-        tier_scores['RESEARCH'] = self._keyword_match(task_description, self.RESEARCH_KEYWORDS)
-        tier_scores['CODE'] = self._keyword_match(task_description, self.CODE_KEYWORDS)
-        tier_scores['COMPLEX'] = self._keyword_match(task_description, self.COMPLEX_KEYWORDS)
+        # Score every keyword set in a single pass over the text
+        counts = self._keyword_counts(text)
+        
+        # Count matches for each tier (key order is the max() tie-break order)
+        vision_matches = counts['VISION']
+        tier_scores = {
+            'FAST': counts['FAST'],
+            'REASONING': counts['REASONING'],
+            'CREATIVE': counts['CREATIVE'],
+            'RESEARCH': counts['RESEARCH'],
+            'CODE': counts['CODE'],
+            'COMPLEX': counts['COMPLEX'],
+            'VISION': vision_matches,
+        }
         
         # Check for vision keywords (highest priority - if image/picture/photo/screenshot present, force VISION)
-        vision_keywords = ['image', 'picture', 'photo', 'screenshot', 'visual', 'see', 'describe what']
-        vision_matches = self._keyword_match(task_description, vision_keywords)
-        tier_scores['VISION'] = vision_matches
-        
         # If vision keywords present, this IS a vision task - override other classifications
         if vision_matches > 0:
             return {
@@ -149,12 +294,8 @@ class FridayRouter:
             }
         
         # Agentic task detection - if multi-step, bump to at least CODE
-        agentic_count = self._keyword_match(task_description, self.AGENTIC_KEYWORDS)
-        multi_step_patterns = [
-            r'\bfirst\b.*\bthen\b', r'\bstep\s+\d+', r'\d+\.\s+\w+',
-            r'\bnext\b', r'\bafter\b', r'\bfinally\b', r',\s*then\b'
-        ]
-        is_multi_step = any(re.search(p, text) for p in multi_step_patterns)
+        agentic_count = counts['AGENTIC']
+        is_multi_step = bool(self._MULTI_STEP_RE.search(text))
         
         if agentic_count >= 2 or is_multi_step:
             # Multi-step task - ensure at least CODE tier
@@ -163,18 +304,15 @@ class FridayRouter:
                 tier_scores['FAST'] = 0  # Override FAST if agentic
         
         # Find best matching tier
-        if max(tier_scores.values()) == 0:
+        max_score = max(tier_scores.values())
+        if max_score == 0:
             # No keywords matched - default to FAST
             best_tier = 'FAST'
         else:
-            best_tier = max(tier_scores, key=tier_scores.get)
+            best_tier = max(tier_scores, key=tier_scores.get)  # type: ignore[arg-type]
         
         # Website/frontend projects → CREATIVE (Kimi k2.5), never CODE
-        website_project_keywords = [
-            'website', 'web site', 'landing page', 'landing', 'frontend',
-            'community site', 'online community', 'build a site', 'new site'
-        ]
-        if self._keyword_match(task_description, website_project_keywords) > 0:
+        if counts['WEBSITE'] > 0:
             best_tier = 'CREATIVE'
         
         # Map COMPLEX to CODE for our tier system
@@ -191,7 +329,6 @@ class FridayRouter:
                 best_tier = 'QUALITY' if tier_scores['COMPLEX'] >= 2 else 'CODE'
         
         # Calculate confidence based on match strength
-        max_score = max(tier_scores.values())
         confidence = min(max_score / 5.0, 1.0)  # Cap at 1.0, normalize around 5 matches = 100%
         
         result = {
@@ -201,9 +338,6 @@ class FridayRouter:
             'is_agentic': agentic_count >= 2 or is_multi_step
         }
         
-        if not return_details:
-            return result['tier']
-        
         return result
     
     def get_default_model(self):
@@ -213,10 +347,7 @@ class FridayRouter:
             # Fallback: QUALITY tier primary
             tier_rules = self.config.get('routing_rules', {}).get('QUALITY', {})
             default_id = tier_rules.get('primary')
-        for m in self.config.get('models', []):
-            if m['id'] == default_id:
-                return m
-        return None
+        return self._models_by_id.get(default_id)
     
     def recommend_model(self, task_description):
         """Classify task and recommend the best model."""
@@ -231,21 +362,12 @@ class FridayRouter:
         primary_id = tier_rules.get('primary')
         
         # Find model in config
-        model = None
-        for m in self.config.get('models', []):
-            if m['id'] == primary_id:
-                model = m
-                break
+        model = self._models_by_id.get(primary_id)
         
         # Fallback
         fallback = None
-        fallback_ids = tier_rules.get('fallback', [])
-        if fallback_ids:
-            for fb_id in fallback_ids:
-                for m in self.config.get('models', []):
-                    if m['id'] == fb_id:
-                        fallback = m
-                        break
+        for fb_id in tier_rules.get('fallback', []):
+            fallback = self._models_by_id.get(fb_id, fallback)
         
         return {
             'tier': tier,
@@ -330,28 +452,54 @@ class FridayRouter:
         }
 
 
+def _build_parser():
+    """
+    Build the CLI argument parser (one subcommand per router action).
+    
+    Task subcommands declare `task` for usage text only: main() hands argparse
+    just the command (and spawn's leading --json) and joins the task words itself.
+    """
+    parser = argparse.ArgumentParser(
+        prog='router.py',
+        description='OpenRouterRouter | Codename: Centipede v1.7.0'
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
+    
+    subparsers.add_parser('default', help='Show session default model (capable by default)')
+    for name, help_text in (
+        ('classify', 'Classify task and recommend model'),
+        ('score', 'Show detailed scoring'),
+        ('cost', 'Estimate cost'),
+    ):
+        sub = subparsers.add_parser(name, help=help_text, add_help=False)
+        sub.add_argument('task', nargs=argparse.REMAINDER, help='Task description')
+    subparsers.add_parser('models', help='List all models')
+    
+    spawn = subparsers.add_parser('spawn', help='Show spawn params for OpenClaw', add_help=False)
+    spawn.add_argument('--json', action='store_true', dest='output_json',
+                       help='Machine-readable output for sessions_spawn (must precede the task)')
+    spawn.add_argument('task', nargs=argparse.REMAINDER, help='Task description')
+    
+    return parser
+
+
 def main():
     """CLI entry point."""
-    if len(sys.argv) < 2:
-        print("OpenRouterRouter | Codename: Centipede v1.7.0")
-        print("\nUsage:")
-        print("  router.py default                Show session default model (capable by default)")
-        print("  router.py classify <task>       Classify task and recommend model")
-        print("  router.py score <task>          Show detailed scoring")
-        print("  router.py cost <task>           Estimate cost")
-        print("  router.py models               List all models")
-        print("  router.py spawn [--json] <task>  Show spawn params for OpenClaw (--json for machine-readable)")
+    parser = _build_parser()
+    argv = sys.argv[1:]
+    
+    # Task words are free-form user text ('-v', '-h', '--json', '--' included), so
+    # argparse never sees them; only a --json right after spawn is a flag
+    head = 2 if argv[:2] == ['spawn', '--json'] else 1
+    args = parser.parse_args(argv[:head])
+    if args.command is None:
+        parser.print_help()
         sys.exit(1)
     
-    command = sys.argv[1]
+    command = args.command
+    task = ' '.join(argv[head:])
     router = FridayRouter()
     
-    # Parse --json for spawn command
-    output_json = False
-    if command == 'spawn' and len(sys.argv) > 2 and sys.argv[2] == '--json':
-        output_json = True
-        sys.argv.pop(2)  # remove --json so task = ' '.join(sys.argv[2:])
-    
     if command == 'default':
         m = router.get_default_model()
         if not m:
@@ -364,7 +512,6 @@ def main():
         print("\n   Simple tasks down-route to FAST tier (e.g. Gemini 2.5 Flash).")
     
     elif command == 'classify':
-        task = ' '.join(sys.argv[2:])
         result = router.recommend_model(task)
         
         print(f"📋 Task: {task}")
@@ -384,7 +531,6 @@ def main():
             print(f"\n🔄 Fallback: {fb['alias']} ({fb['id']})")
     
     elif command == 'score':
-        task = ' '.join(sys.argv[2:])
         result = router.classify_task(task, return_details=True)
         
         print(f"📋 Task: {task}")
@@ -398,7 +544,6 @@ def main():
             print(f"   {tier:10} {bar} ({score})")
     
     elif command == 'cost':
-        task = ' '.join(sys.argv[2:])
         result = router.estimate_cost(task)
         
         if 'error' in result:
@@ -417,13 +562,12 @@ def main():
             print(f"                         ${model['input_cost_per_m']}/${model['output_cost_per_m']}/M")
     
     elif command == 'spawn':
-        task = ' '.join(sys.argv[2:])
         if not task:
             print("❌ Error: spawn requires a task string", file=sys.stderr)
             sys.exit(1)
         result = router.spawn_agent(task)
         
-        if output_json:
+        if args.output_json:
             # Machine-readable: single JSON object for sessions_spawn
             # Note: Gateway auth secrets are NOT included - use gateway-guard skill separately if needed
             out = {k: v for k, v in result['params'].items()}
@@ -436,10 +580,6 @@ def main():
             print(f"\n📦 Full recommendation:")
             print(f"   Tier: {result['recommendation']['tier']}")
             print(f"   Model: {result['recommendation']['model']['alias']}")
-    
-    else:
-        print(f"Unknown command: {command}")
-        sys.exit(1)
 
 
 if __name__ == '__main__':
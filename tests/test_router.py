@@ -0,0 +1,85 @@
+"""
+Keyword scoring regression tests for scripts/router.py.
+
+Both matcher backends (compiled regex, optional Aho-Corasick) must give the
+same distinct-substring counts as the original `kw in text` scan.
+
+Run: python -m unittest discover tests
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import router  # noqa: E402
+from router import FridayRouter  # noqa: E402
+
+
+# Overlaps the matchers must credit exactly like a per-keyword `in` check
+OVERLAP_TASKS = [
+    'explain the reasoning',            # 'reasoning' also contains 'reason'
+    'build the settings page',          # 'ui' inside 'build', 'test' inside 'settings'
+    'search google for golang tips',    # 'go' inside 'google' and 'golang'
+    'what are the top alternatives',    # 'what are', 'top', 'alternatives'
+    'design a landing page website',    # 'landing' and 'landing page' overlap
+    'Describe What you SEE in the UI',  # case-insensitive, mixed-case 'UI' keyword
+    'reasonreasoning reason',           # repeated keywords count once
+    'summary of the summaries',
+    '',
+]
+
+
+def naive_count(text, keywords):
+    """The original _keyword_match: one `in` scan per keyword."""
+    text_lower = text.lower()
+    return sum(1 for kw in keywords if kw.lower() in text_lower)
+
+
+def random_tasks(count=2000, seed=7):
+    """Random tasks stitched from keywords, keyword fragments and filler words."""
+    words = [kw for kws in FridayRouter._KEYWORD_SETS.values() for kw in kws]
+    words += [kw[:-1] for kw in words if len(kw) > 2]
+    words += ['the', 'a', 'server', 'please', 'foo', '1.', 'Ünicode', 'İstanbul']
+    rng = random.Random(seed)
+    tasks = []
+    for _ in range(count):
+        picked = [rng.choice(words) for _ in range(rng.randint(1, 12))]
+        tasks.append(''.join(picked) if rng.random() < 0.2 else ' '.join(picked))
+    return tasks
+
+
+class KeywordMatchTest(unittest.TestCase):
+    """Both keyword backends match the naive substring count."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.router = FridayRouter()
+        cls.tasks = OVERLAP_TASKS + random_tasks()
+
+    def expected(self, text):
+        return {key: naive_count(text, kws) for key, kws in FridayRouter._KEYWORD_SETS.items()}
+
+    def test_overlap_examples(self):
+        text = 'explain the reasoning'.lower()
+        self.assertEqual(self.router._keyword_match(text, 'REASONING'), 3)  # explain, reason, reasoning
+        self.assertEqual(self.router._keyword_match('build', 'CREATIVE'), 1)  # 'ui'
+        self.assertEqual(self.router._keyword_match('google', 'CODE'), 1)  # 'go'
+
+    def test_regex_backend(self):
+        for text in self.tasks:
+            counts = {key: self.router._keyword_match(text.lower(), key)
+                      for key in FridayRouter._KEYWORD_SETS}
+            self.assertEqual(counts, self.expected(text), text)
+
+    @unittest.skipUnless(router.HAS_AHOCORASICK, 'pyahocorasick not installed')
+    def test_automaton_backend(self):
+        self.assertIsNotNone(FridayRouter._AUTOMATON)
+        for text in self.tasks:
+            self.assertEqual(self.router._keyword_counts(text.lower()), self.expected(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()